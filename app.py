@@ -1,10 +1,21 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, Response, stream_with_context
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import logging
+import logging.handlers
+import queue
+import atexit
 from dotenv import load_dotenv
 import time
+import threading
+import hashlib
 import json
+import orjson
+import msgspec
+from typing import Any, Dict, List, Optional, Union
+from cachetools import TTLCache
 
 # Load environment variables from .env file if it exists
 load_dotenv()
@@ -21,12 +32,54 @@ console_handler.setFormatter(console_formatter)
 
 # Create a separate logger for request/response details
 request_logger = logging.getLogger('request_logger')
-request_logger.setLevel(logging.DEBUG)
-request_logger.addHandler(console_handler)
+# Set REQUEST_LOG_LEVEL=INFO in production to skip building the debug messages entirely
+request_logger.setLevel(os.environ.get('REQUEST_LOG_LEVEL', 'DEBUG').upper())
 request_logger.propagate = False  # Don't propagate to parent logger
 
+# Request threads only enqueue records; a background listener thread does the
+# timestamp formatting and the (serializing) write to the console.
+log_queue = queue.Queue(-1)
+request_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+log_listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on shutdown
+
+class LazyJSON:
+    """Defer JSON serialization of a log argument until the record is actually formatted."""
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self):
+        return encode_json(self.obj).decode()
+
+def _json_default(obj):
+    """Serialize mapping types orjson doesn't know about, such as request.headers."""
+    if hasattr(obj, "keys"):
+        return dict(obj)
+    raise TypeError
+
+def encode_json(obj, sort_keys=False):
+    """Encode obj with orjson, falling back to stdlib json for values orjson rejects (e.g. ints wider than 64 bits)."""
+    try:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, default=_json_default, sort_keys=sort_keys, separators=(",", ":")).encode()
+
+def decode_response(response):
+    """Decode a Databricks JSON response, raising requests' JSONDecodeError (a RequestException) if it is invalid."""
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos, response=response) from e
+
 app = Flask(__name__)
 
+def orjson_response(obj, status=200):
+    """Serialize obj with orjson and wrap it in a JSON response."""
+    return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+
 # Get Databricks token from environment variables
 DATABRICKS_TOKEN = os.environ.get('DATABRICKS_TOKEN')
 if not DATABRICKS_TOKEN:
@@ -36,6 +89,108 @@ if not DATABRICKS_TOKEN:
 BASE_URL = os.environ.get('DATABRICKS_BASE_URL', 
                         "https://dbc-dc8dabd2-571d.cloud.databricks.com/serving-endpoints")
 
+# Shared HTTP session so connections to Databricks are kept alive and reused
+# across requests instead of paying a TCP+TLS handshake on every call.
+# Invocations are POSTs that Databricks may already have run when a read error
+# or error status comes back, so only connection failures (nothing sent yet) are retried.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=128,
+    max_retries=Retry(total=2, read=0, backoff_factor=0.1)
+))
+SESSION.headers.update({
+    "Authorization": f"Bearer {DATABRICKS_TOKEN}",
+    "Connection": "keep-alive",
+    "Content-Type": "application/json"
+})
+
+class RequestCoalescer:
+    """Share a single upstream call between identical requests that are in flight at the same time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def run(self, key, fn):
+        """Return fn()'s result, reusing the result of an identical in-flight call if there is one."""
+        with self._lock:
+            call = self._inflight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._inflight[key] = {"done": threading.Event(), "result": None, "error": None}
+
+        if not is_leader:
+            request_logger.debug("Coalesced with identical in-flight request to Databricks")
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = fn()
+            return call["result"]
+        except BaseException as e:
+            # Also covers GreenletExit/Timeout, so waiters never mistake a dead leader for a None result
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call["done"].set()
+
+# Deterministic requests (temperature == 0) with identical bodies get identical
+# answers, so concurrent duplicates can safely wait on the first one's response.
+INFLIGHT_REQUESTS = RequestCoalescer()
+
+def is_deterministic(databricks_request):
+    """Return True if identical copies of this request yield identical completions."""
+    return databricks_request.get("temperature") == 0 and not databricks_request.get("stream")
+
+class ResponseCache:
+    """Thread-safe TTL cache of serialized responses to deterministic requests."""
+
+    def __init__(self, maxsize, ttl):
+        self._lock = threading.Lock()
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def key(endpoint, databricks_request):
+        """Build a cache key from the endpoint name and the outgoing request."""
+        return hashlib.blake2b(
+            endpoint.encode() + encode_json(databricks_request, sort_keys=True)
+        ).digest()
+
+    def get(self, key):
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key, body):
+        with self._lock:
+            self._cache[key] = body
+
+RESPONSE_CACHE = ResponseCache(
+    maxsize=int(os.environ.get('RESPONSE_CACHE_SIZE', 4096)),
+    ttl=int(os.environ.get('RESPONSE_CACHE_TTL', 600))
+)
+
+def invoke_model(model_id, databricks_request, stream=False):
+    """POST a request to the Databricks invocations endpoint for model_id."""
+    body = encode_json(databricks_request)
+    
+    def send():
+        return SESSION.post(
+            _INVOKE_URL[model_id],
+            data=body,
+            stream=stream,
+            timeout=120
+        )
+    
+    # A streamed body can only be consumed once, so streamed calls are never shared
+    if not stream and is_deterministic(databricks_request):
+        return INFLIGHT_REQUESTS.run((model_id, body), send)
+    return send()
+
 # Model configurations
 DEFAULT_MODEL = "databricks-meta-llama-3-1-405b-instruct"
 AVAILABLE_MODELS = os.environ.get('AVAILABLE_MODELS', DEFAULT_MODEL).split(',')
@@ -46,64 +201,122 @@ CONFIG = {
                for model_id in AVAILABLE_MODELS}
 }
 
+# Invocation URL for each configured model, built once instead of per request
+_INVOKE_URL = {model_id: f"{BASE_URL}/{model_id}/invocations" for model_id in CONFIG["models"]}
+
+# Static response bodies, serialized once at startup since they never change
+_MODELS_BODY = orjson.dumps({"data": list(CONFIG["models"].values()), "object": "list"})
+_HEALTH_BODY = b'{"status":"ok"}'
+
+# Request bodies accepted by the OpenAI-compatible endpoints; unknown fields are ignored
+class ChatRequest(msgspec.Struct):
+    model: str = DEFAULT_MODEL
+    messages: List[Dict[str, Any]] = []
+    max_tokens: Union[int, float, None] = 2048
+    temperature: Optional[float] = 0.7
+    top_p: Optional[float] = 1.0
+    stop: Union[str, List[str], None] = []
+    stream: Optional[bool] = False
+
+class CompletionRequest(msgspec.Struct):
+    model: str = DEFAULT_MODEL
+    prompt: Union[str, List[Any]] = ""
+    max_tokens: Union[int, float, None] = 256
+
+class EmbeddingRequest(msgspec.Struct):
+    model: str = DEFAULT_MODEL
+    input: Union[str, List[Any]] = ""
+
+# Response shape of /v1/completions, which is rebuilt from the Databricks chat response
+class CompletionChoice(msgspec.Struct):
+    text: str
+    index: int = 0
+    logprobs: Optional[Any] = None
+    finish_reason: Optional[str] = "stop"
+
+class CompletionResponse(msgspec.Struct, kw_only=True):
+    id: str
+    object: str = "text_completion"
+    created: int
+    model: str
+    choices: List[CompletionChoice]
+    usage: Dict[str, Any]
+
+def decode_request(request_type):
+    """Decode and validate the JSON request body as request_type."""
+    return msgspec.json.decode(request.get_data(), type=request_type)
+
+def loggable_body(raw):
+    """Render a raw request body for the log on a single line, so clients can't forge log records."""
+    try:
+        # Untyped msgspec decoding keeps ints wider than 64 bits exact, unlike orjson.loads
+        return LazyJSON(msgspec.json.decode(raw))
+    except msgspec.DecodeError:
+        return repr(raw)
+
 @app.route('/v1/models', methods=['GET'])
 def get_models():
     """Return a list of available models."""
     logger.info("GET request to /v1/models")
-    request_logger.debug(f"GET /v1/models - Headers: {dict(request.headers)}")
-    models_data = [CONFIG["models"][model_id] for model_id in CONFIG["models"]]
-    return jsonify({
-        "data": models_data,
-        "object": "list"
-    })
+    if request_logger.isEnabledFor(logging.DEBUG):
+        request_logger.debug("GET /v1/models - Headers: %s", LazyJSON(request.headers))
+    return Response(_MODELS_BODY, mimetype="application/json")
 
 @app.route('/v1/chat/completions', methods=['POST'])
 def chat_completions():
     """Handle chat completion requests."""
-    data = request.json
-    logger.info(f"POST request to /v1/chat/completions with model: {data.get('model', DEFAULT_MODEL)}")
-    
     # Log detailed request information
-    request_logger.debug(f"INCOMING REQUEST - POST /v1/chat/completions")
-    request_logger.debug(f"Request Headers: {dict(request.headers)}")
-    request_logger.debug(f"Request Body: {json.dumps(data, indent=2)}")
+    if request_logger.isEnabledFor(logging.DEBUG):
+        request_logger.debug("INCOMING REQUEST - POST /v1/chat/completions")
+        request_logger.debug("Request Headers: %s", LazyJSON(request.headers))
+        request_logger.debug("Request Body: %s", loggable_body(request.get_data()))
+    
+    try:
+        req = decode_request(ChatRequest)
+    except msgspec.DecodeError as e:
+        request_logger.error(f"Invalid request body: {str(e)}")
+        return orjson_response({"error": f"Invalid request body: {e}"}, status=400)
+    logger.info(f"POST request to /v1/chat/completions with model: {req.model}")
     
     # Extract model ID from request or use default
-    model_id = data.get('model', DEFAULT_MODEL)
+    model_id = req.model
     
     # Validate model exists in our configuration
     if model_id not in CONFIG["models"]:
-        return jsonify({"error": f"Model {model_id} not found"}), 404
+        return orjson_response({"error": f"Model {model_id} not found"}, status=404)
     
     # Format the request for Databricks API
     # The key aspect here is formatting the request correctly for Databricks
-    messages = data.get("messages", [])
+    messages = req.messages
     
     # Process messages to ensure content is a string (Databricks requirement)
     processed_messages = []
     for msg in messages:
-        msg_copy = msg.copy()
-        # If content is an array, convert it to a string
-        if isinstance(msg_copy.get("content"), list):
+        # If content is an array, convert it to a string; plain string content
+        # (the common case) is forwarded as-is without copying the message
+        if isinstance(msg.get("content"), list):
+            msg_copy = dict(msg)
             # Extract text content from array items
             text_content = []
             for item in msg_copy["content"]:
                 if isinstance(item, dict) and item.get("type") == "text":
                     text_content.append(item.get("text", ""))
             msg_copy["content"] = "\n".join(text_content)
-        processed_messages.append(msg_copy)
+            processed_messages.append(msg_copy)
+        else:
+            processed_messages.append(msg)
         
-    temperature = data.get('temperature', 0.7)
-    top_p = data.get('top_p', 1.0)
-    stop_sequences = data.get('stop', [])
+    stream = bool(req.stream)
     
     databricks_request = {
         "model": model_id,
-        "max_tokens": data.get("max_tokens", 2048),
-        "temperature": temperature,
-        "top_p": top_p,
-        "stop": stop_sequences,
+        "max_tokens": req.max_tokens,
+        "temperature": req.temperature,
+        "top_p": req.top_p,
+        "stop": req.stop,
     }
+    if stream:
+        databricks_request["stream"] = True
     
     # Make the request to Databricks API
     try:
@@ -112,52 +325,70 @@ def chat_completions():
         
         databricks_request["messages"] = processed_messages
         
-        request_logger.debug(f"OUTGOING REQUEST - POST {BASE_URL}/{model_id}/invocations")
-        request_logger.debug(f"Outgoing Headers: {{'Authorization': 'Bearer [REDACTED]'}}")
-        request_logger.debug(f"Outgoing Body: {json.dumps(databricks_request, indent=2)}")
-        response = requests.post(
-            f"{BASE_URL}/{model_id}/invocations",
-            headers={"Authorization": f"Bearer {DATABRICKS_TOKEN}"},
-            json=databricks_request,
-            timeout=120
-        )
+        # Serve repeated deterministic requests from the response cache
+        cache_key = None
+        if is_deterministic(databricks_request):
+            cache_key = ResponseCache.key("chat.completion", databricks_request)
+            cached_body = RESPONSE_CACHE.get(cache_key)
+            if cached_body is not None:
+                request_logger.debug("Serving cached response for model %s", model_id)
+                return Response(cached_body, mimetype="application/json")
+        
+        request_logger.debug("OUTGOING REQUEST - POST %s", _INVOKE_URL[model_id])
+        request_logger.debug("Outgoing Headers: {'Authorization': 'Bearer [REDACTED]'}")
+        request_logger.debug("Outgoing Body: %s", LazyJSON(databricks_request))
+        response = invoke_model(model_id, databricks_request, stream=stream)
         
         # Check if request was successful
         response.raise_for_status()
         
         # Log response from Databricks
-        request_logger.debug(f"RESPONSE from Databricks - Status Code: {response.status_code}")
-        request_logger.debug(f"Response Body: {json.dumps(response.json(), indent=2)}")
+        request_logger.debug("RESPONSE from Databricks - Status Code: %s", response.status_code)
         
-        # Return the response in OpenAI format
-        # Transform Databricks response to OpenAI format
-        databricks_response = response.json()
+        # Streaming: forward Databricks' server-sent events to the client as they arrive.
+        # Chunks are relayed untouched; direct_passthrough hands the byte iterator
+        # straight to the WSGI server and stream_with_context keeps the request context alive.
+        if stream:
+            def generate():
+                try:
+                    yield from response.iter_content(chunk_size=None)
+                finally:
+                    response.close()
+            return Response(
+                stream_with_context(generate()),
+                mimetype="text/event-stream",
+                headers={"Cache-Control": "no-cache"},
+                direct_passthrough=True
+            )
         
-        # Transform Databricks response to OpenAI format
-        # This is a simplified version and may need adjustments
-        openai_format_response = {
-            "id": f"chatcmpl-{databricks_response.get('id', 'unknown')}",
-            "object": "chat.completion",
-            "created": databricks_response.get("created", int(time.time())),
-            "model": model_id,
-            "choices": [
-                {
-                    "index": 0,
-                    "message": {
-                        "role": "assistant",
-                        "content": databricks_response.get("choices", [{}])[0].get("message", {}).get("content", "")
-                    },
-                    "finish_reason": databricks_response.get("choices", [{}])[0].get("finish_reason", "stop")
-                }
-            ],
-            "usage": databricks_response.get("usage", {
-                "prompt_tokens": 0,
-                "completion_tokens": 0,
-                "total_tokens": 0
-            })
-        }
+        # Parse the Databricks response once; it is reused for logging and the transform
+        databricks_response = decode_response(response)
+        request_logger.debug("Response Body: %s", LazyJSON(databricks_response))
         
-        return jsonify(openai_format_response)
+        # Return the response in OpenAI format
+        # Databricks already answers in the chat completion format, so only the
+        # fields that differ are rewritten and everything else is passed through
+        databricks_response["id"] = f"chatcmpl-{databricks_response.get('id', 'unknown')}"
+        databricks_response["object"] = "chat.completion"
+        databricks_response["model"] = model_id
+        databricks_response.setdefault("created", int(time.time()))
+        databricks_response.setdefault("choices", [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": ""},
+                "finish_reason": "stop"
+            }
+        ])
+        databricks_response.setdefault("usage", {
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0
+        })
+        
+        body = orjson.dumps(databricks_response)
+        if cache_key is not None:
+            RESPONSE_CACHE.set(cache_key, body)
+        return Response(body, mimetype="application/json")
     
     except requests.exceptions.RequestException as e:
         # Log error response
@@ -165,29 +396,34 @@ def chat_completions():
         if hasattr(e, 'response') and e.response is not None:
             request_logger.error(f"Error Response Body: {e.response.text}")
         logger.error(f"Error making request to Databricks API: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return orjson_response({"error": str(e)}, status=500)
 
 @app.route('/v1/completions', methods=['POST'])
 def completions():
     """Handle standard completion requests."""
-    data = request.json
-    logger.info(f"POST request to /v1/completions with model: {data.get('model', DEFAULT_MODEL)}")
-    
     # Log detailed request information
-    request_logger.debug(f"INCOMING REQUEST - POST /v1/completions")
-    request_logger.debug(f"Request Headers: {dict(request.headers)}")
-    request_logger.debug(f"Request Body: {json.dumps(data, indent=2)}")
+    if request_logger.isEnabledFor(logging.DEBUG):
+        request_logger.debug("INCOMING REQUEST - POST /v1/completions")
+        request_logger.debug("Request Headers: %s", LazyJSON(request.headers))
+        request_logger.debug("Request Body: %s", loggable_body(request.get_data()))
+    
+    try:
+        req = decode_request(CompletionRequest)
+    except msgspec.DecodeError as e:
+        request_logger.error(f"Invalid request body: {str(e)}")
+        return orjson_response({"error": f"Invalid request body: {e}"}, status=400)
+    logger.info(f"POST request to /v1/completions with model: {req.model}")
     
     # Extract model ID from request or use default
-    model_id = data.get('model', DEFAULT_MODEL)
+    model_id = req.model
     
     # Validate model exists in our configuration
     if model_id not in CONFIG["models"]:
-        return jsonify({"error": f"Model {model_id} not found"}), 404
+        return orjson_response({"error": f"Model {model_id} not found"}, status=404)
     
     # For completion endpoint, convert to a format that the chat model can understand
     # This is necessary because many LLM models now prefer the chat format
-    prompt = data.get("prompt", "")
+    prompt = req.prompt
     
     # Create a messages array with a single user message containing the prompt
     # Handle case where prompt might be an array
@@ -202,62 +438,53 @@ def completions():
     
     messages = [{"role": "user", "content": prompt_text}]
     
-    temperature = data.get('temperature', 0.7)
-    top_p = data.get('top_p', 1.0)
-    stop_sequences = data.get('stop', [])
-    
     # Format the request for Databricks API
     databricks_request = {
         "messages": messages, 
         "model": model_id, 
-        "max_tokens": data.get("max_tokens", 256)
+        "max_tokens": req.max_tokens
     }
     
     # Make the request to Databricks API
     try:
         # Log outgoing request to Databricks
-        request_logger.debug(f"OUTGOING REQUEST - POST {BASE_URL}/{model_id}/invocations")
-        request_logger.debug(f"Outgoing Headers: {{'Authorization': 'Bearer [REDACTED]'}}")
-        request_logger.debug(f"Outgoing Body: {json.dumps(databricks_request, indent=2)}")
-        response = requests.post(
-            f"{BASE_URL}/{model_id}/invocations",
-            headers={"Authorization": f"Bearer {DATABRICKS_TOKEN}"},
-            json=databricks_request,
-            timeout=120
-        )
+        request_logger.debug("OUTGOING REQUEST - POST %s", _INVOKE_URL[model_id])
+        request_logger.debug("Outgoing Headers: {'Authorization': 'Bearer [REDACTED]'}")
+        request_logger.debug("Outgoing Body: %s", LazyJSON(databricks_request))
+        response = invoke_model(model_id, databricks_request)
         
         # Check if request was successful
         response.raise_for_status()
         
+        # Parse the Databricks response once; it is reused for logging and the transform
+        databricks_response = decode_response(response)
+        
         # Log response from Databricks
-        request_logger.debug(f"RESPONSE from Databricks - Status Code: {response.status_code}")
-        request_logger.debug(f"Response Body: {json.dumps(response.json(), indent=2)}")
+        request_logger.debug("RESPONSE from Databricks - Status Code: %s", response.status_code)
+        request_logger.debug("Response Body: %s", LazyJSON(databricks_response))
         
         # Return the response in OpenAI format
-        databricks_response = response.json()
         
         # Transform to completions format (different from chat.completions)
-        openai_format_response = {
-            "id": f"cmpl-{databricks_response.get('id', 'unknown')}",
-            "object": "text_completion",
-            "created": databricks_response.get("created", int(time.time())),
-            "model": model_id,
-            "choices": [
-                {
-                    "text": databricks_response.get("choices", [{}])[0].get("message", {}).get("content", ""),
-                    "index": 0,
-                    "logprobs": None,
-                    "finish_reason": databricks_response.get("choices", [{}])[0].get("finish_reason", "stop")
-                }
+        first_choice = (databricks_response.get("choices") or [{}])[0]
+        openai_format_response = CompletionResponse(
+            id=f"cmpl-{databricks_response.get('id', 'unknown')}",
+            created=databricks_response.get("created", int(time.time())),
+            model=model_id,
+            choices=[
+                CompletionChoice(
+                    text=first_choice.get("message", {}).get("content", ""),
+                    finish_reason=first_choice.get("finish_reason", "stop")
+                )
             ],
-            "usage": databricks_response.get("usage", {
+            usage=databricks_response.get("usage", {
                 "prompt_tokens": 0,
                 "completion_tokens": 0,
                 "total_tokens": 0
             })
-        }
+        )
         
-        return jsonify(openai_format_response)
+        return Response(msgspec.json.encode(openai_format_response), mimetype="application/json")
     
     except requests.exceptions.RequestException as e:
         # Log error response
@@ -265,34 +492,39 @@ def completions():
         if hasattr(e, 'response') and e.response is not None:
             request_logger.error(f"Error Response Body: {e.response.text}")
         logger.error(f"Error making request to Databricks API: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return orjson_response({"error": str(e)}, status=500)
 
 @app.route('/v1/embeddings', methods=['POST'])
 def embeddings():
     """Handle embedding requests."""
-    data = request.json
-    logger.info(f"POST request to /v1/embeddings with model: {data.get('model', DEFAULT_MODEL)}")
-    
     # Log detailed request information
-    request_logger.debug(f"INCOMING REQUEST - POST /v1/embeddings")
-    request_logger.debug(f"Request Headers: {dict(request.headers)}")
-    request_logger.debug(f"Request Body: {json.dumps(data, indent=2)}")
+    if request_logger.isEnabledFor(logging.DEBUG):
+        request_logger.debug("INCOMING REQUEST - POST /v1/embeddings")
+        request_logger.debug("Request Headers: %s", LazyJSON(request.headers))
+        request_logger.debug("Request Body: %s", loggable_body(request.get_data()))
+    
+    try:
+        req = decode_request(EmbeddingRequest)
+    except msgspec.DecodeError as e:
+        request_logger.error(f"Invalid request body: {str(e)}")
+        return orjson_response({"error": f"Invalid request body: {e}"}, status=400)
+    logger.info(f"POST request to /v1/embeddings with model: {req.model}")
     
     # Currently, this is a simple passthrough to the Databricks API
     # In a real implementation, you'd need to adjust this based on the
     # actual Databricks embedding endpoint and its requirements
     
-    model_id = data.get('model', DEFAULT_MODEL)
+    model_id = req.model
     
     # Format the request for Databricks API
     databricks_request = {
-        "input": data.get("input", ""),
+        "input": req.input,
         "model": model_id
     }
     
     # For now, this is a placeholder response since the embedding functionality
     # is less important as mentioned in the original task
-    return jsonify({
+    return orjson_response({
         "object": "list",
         "data": [
             {
@@ -311,17 +543,18 @@ def embeddings():
 @app.route('/healthcheck', methods=['GET'])
 def healthcheck():
     """Simple health check endpoint."""
-    request_logger.debug(f"GET /healthcheck - Headers: {dict(request.headers)}")
-    return jsonify({"status": "ok"})
+    if request_logger.isEnabledFor(logging.DEBUG):
+        request_logger.debug("GET /healthcheck - Headers: %s", LazyJSON(request.headers))
+    return Response(_HEALTH_BODY, mimetype="application/json")
 
 # Error handlers
 @app.errorhandler(404)
 def not_found(e):
-    return jsonify({"error": "Not found"}), 404
+    return orjson_response({"error": "Not found"}, status=404)
 
 @app.errorhandler(500)
 def server_error(e):
-    return jsonify({"error": "Internal server error"}), 500
+    return orjson_response({"error": "Internal server error"}, status=500)
 
 if __name__ == '__main__':
     # Load additional configuration if needed
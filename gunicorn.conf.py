@@ -0,0 +1,16 @@
+"""
+Gunicorn configuration for the Databricks Gateway API wrapper.
+Upstream Databricks calls can take seconds, so each worker serves requests
+from greenlets rather than blocking a whole process per request.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# gevent workers yield to other requests while waiting on the Databricks socket,
+# so each process can keep up to worker_connections upstream calls in flight.
+# The app is loaded through wsgi.py, which monkey-patches the stdlib first.
+worker_class = "gevent"
+workers = int(os.environ.get('GUNICORN_WORKERS', 4))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
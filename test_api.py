@@ -8,6 +8,9 @@ import requests
 import json
 import os
 import sys
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables from .env file if it exists
@@ -16,6 +19,33 @@ load_dotenv()
 # Base URL for the API
 BASE_URL = "http://localhost:5001/v1"
 
+# Shared session so the test requests reuse connections to the server
+SESSION = requests.Session()
+
+# Tests run concurrently, so each thread's output is collected separately
+# and printed in order once all tests have finished
+_thread_output = threading.local()
+
+class _ThreadLocalStdout:
+    """Route print() output to the current thread's buffer, or to the stream it replaced"""
+    def __init__(self, fallback):
+        self.fallback = fallback
+
+    def write(self, text):
+        return getattr(_thread_output, 'buffer', self.fallback).write(text)
+
+    def flush(self):
+        getattr(_thread_output, 'buffer', self.fallback).flush()
+
+def run_captured(test):
+    """Run a test function and return everything it printed"""
+    _thread_output.buffer = io.StringIO()
+    try:
+        test()
+        return _thread_output.buffer.getvalue()
+    finally:
+        del _thread_output.buffer
+
 def print_section(title):
     """Print a section title with formatting"""
     print("\n" + "="*80)
@@ -31,7 +61,7 @@ def test_healthcheck():
     print_section("Testing Healthcheck Endpoint")
     
     try:
-        response = requests.get(f"{BASE_URL.replace('/v1', '')}/healthcheck")
+        response = SESSION.get(f"{BASE_URL.replace('/v1', '')}/healthcheck")
         print(f"Status Code: {response.status_code}")
         pretty_print_json(response.json())
         
@@ -49,7 +79,7 @@ def test_models_endpoint():
     print_section("Testing Models Endpoint")
     
     try:
-        response = requests.get(f"{BASE_URL}/models")
+        response = SESSION.get(f"{BASE_URL}/models")
         print(f"Status Code: {response.status_code}")
         pretty_print_json(response.json())
         
@@ -67,7 +97,7 @@ def test_chat_completions():
     
     try:
         # Get the first model from the list
-        models_response = requests.get(f"{BASE_URL}/models")
+        models_response = SESSION.get(f"{BASE_URL}/models")
         models = models_response.json().get("data", [])
         
         if not models:
@@ -91,7 +121,7 @@ def test_chat_completions():
         print("\nRequest:")
         pretty_print_json(request_data)
         
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/chat/completions", 
             json=request_data
         )
@@ -114,7 +144,7 @@ def test_completions():
     
     try:
         # Get the first model from the list
-        models_response = requests.get(f"{BASE_URL}/models")
+        models_response = SESSION.get(f"{BASE_URL}/models")
         models = models_response.json().get("data", [])
         
         if not models:
@@ -136,7 +166,7 @@ def test_completions():
         print("\nRequest:")
         pretty_print_json(request_data)
         
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/completions", 
             json=request_data
         )
@@ -158,10 +188,16 @@ def main():
     print("Starting Databricks Gateway API Tests")
     print(f"Base URL: {BASE_URL}")
     
-    test_healthcheck()
-    test_models_endpoint()
-    test_chat_completions()
-    test_completions()
+    tests = [test_healthcheck, test_models_endpoint, test_chat_completions, test_completions]
+    orig_stdout = sys.stdout
+    sys.stdout = _ThreadLocalStdout(orig_stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            outputs = list(executor.map(run_captured, tests))
+    finally:
+        sys.stdout = orig_stdout
+    for output in outputs:
+        print(output, end="")
     
     print_section("Test Summary")
     print("All tests completed! Check the results above for any failures.")
@@ -7,6 +7,10 @@ This script provides a formatted view of the API request logs.
 import sys
 import re
 import json
+import mmap
+import stat
+import orjson
+import msgspec
 from datetime import datetime
 import argparse
 import os
@@ -25,29 +29,40 @@ COLORS = {
     'UNDERLINE': '\033[4m'
 }
 
+# (prefix, suffix) escape codes per color, so colorize needs a single lookup
+_WRAP = {name: (code, COLORS['RESET']) for name, code in COLORS.items()}
+_NO_COLOR = ('', COLORS['RESET'])
+
 def colorize(text, color):
     """Add color to text for terminal output"""
-    return f"{COLORS.get(color, '')}{text}{COLORS['RESET']}"
+    prefix, suffix = _WRAP.get(color, _NO_COLOR)
+    return prefix + str(text) + suffix
 
 def format_json(json_str):
     """Format JSON string for better readability"""
+    # msgspec keeps ints wider than 64 bits exact (orjson.loads turns them into floats);
+    # orjson can't encode those, so such bodies fall back to the stdlib encoder
     try:
-        parsed = json.loads(json_str)
-        return json.dumps(parsed, indent=2)
-    except:
+        parsed = msgspec.json.decode(json_str)
+    except msgspec.DecodeError:
         return json_str
+    try:
+        return orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(parsed, indent=2, ensure_ascii=False)
+
+# Matches "timestamp - level - message" at the start of any line in the log buffer
+_LINE_RE = re.compile(rb'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - (\w+) - (.*)', re.MULTILINE)
 
-def parse_log_line(line):
-    """Parse a log line into timestamp, level, and message"""
-    match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - (\w+) - (.*)', line)
-    if match:
+def parse_log_lines(buffer):
+    """Yield the timestamp, level, and message of each log line in a bytes-like buffer"""
+    for match in _LINE_RE.finditer(buffer):
         timestamp, level, message = match.groups()
-        return {
-            'timestamp': timestamp,
-            'level': level,
-            'message': message
+        yield {
+            'timestamp': timestamp.decode('ascii'),
+            'level': level.decode('ascii'),
+            'message': message.decode('utf-8', 'replace')
         }
-    return None
 
 def group_request_logs(log_lines):
     """Group log lines by request"""
@@ -55,9 +70,6 @@ def group_request_logs(log_lines):
     current_request = None
     
     for line_data in log_lines:
-        if line_data is None:
-            continue
-            
         message = line_data['message']
         
         # Start of a new request
@@ -80,6 +92,70 @@ def group_request_logs(log_lines):
         
     return requests
 
+def _show_request_headers(message):
+    """Print the incoming request headers, one per line"""
+    print(colorize("\nREQUEST HEADERS:", 'BLUE'))
+    headers_str = message[len('Request Headers: '):]
+    try:
+        headers = orjson.loads(headers_str)
+        for key, value in headers.items():
+            print(f"  {colorize(key, 'CYAN')}: {value}")
+    except (orjson.JSONDecodeError, AttributeError):
+        print(f"  {headers_str}")
+
+def _show_request_body(message):
+    """Print the incoming request body as formatted JSON"""
+    print(colorize("\nREQUEST BODY:", 'BLUE'))
+    print(f"  {format_json(message[len('Request Body: '):])}")
+
+def _show_outgoing_request(message):
+    """Print the method and URL of the request forwarded to Databricks"""
+    print(colorize("\nOUTGOING REQUEST:", 'MAGENTA'))
+    print(f"  {message.split(' - ')[1]}")
+
+def _show_outgoing_headers(message):
+    """Print the (redacted) headers sent to Databricks"""
+    print(colorize("\nOUTGOING HEADERS:", 'MAGENTA'))
+    print(f"  {message[len('Outgoing Headers: '):]}")
+
+def _show_outgoing_body(message):
+    """Print the body sent to Databricks as formatted JSON"""
+    print(colorize("\nOUTGOING BODY:", 'MAGENTA'))
+    print(f"  {format_json(message[len('Outgoing Body: '):])}")
+
+def _show_response(message):
+    """Print the status code returned by Databricks"""
+    print(colorize("\nRESPONSE:", 'GREEN'))
+    print(f"  {message.split(' - ')[1]}")
+
+def _show_response_body(message):
+    """Print the Databricks response body as formatted JSON"""
+    print(colorize("\nRESPONSE BODY:", 'GREEN'))
+    print(f"  {format_json(message[len('Response Body: '):])}")
+
+def _show_error_response_body(message):
+    """Print the body of a failed Databricks response as formatted JSON"""
+    print(colorize("\nERROR RESPONSE BODY:", 'RED'))
+    print(f"  {format_json(message[len('Error Response Body: '):])}")
+
+def _show_error(message):
+    """Print a generic error line"""
+    print(colorize("\nERROR:", 'RED'))
+    print(f"  {message}")
+
+# Log message kinds, keyed by the text before the first ':' or ' - ' in the message,
+# mapped to (handler, shown only in verbose mode)
+_DETAIL_HANDLERS = {
+    'Request Headers': (_show_request_headers, True),
+    'Request Body': (_show_request_body, False),
+    'OUTGOING REQUEST': (_show_outgoing_request, False),
+    'Outgoing Headers': (_show_outgoing_headers, True),
+    'Outgoing Body': (_show_outgoing_body, False),
+    'RESPONSE from Databricks': (_show_response, False),
+    'Response Body': (_show_response_body, False),
+    'Error Response Body': (_show_error_response_body, False),
+}
+
 def display_request(request, verbose=False):
     """Display a formatted request"""
     print(colorize(f"\n{'='*80}", 'BOLD'))
@@ -87,87 +163,36 @@ def display_request(request, verbose=False):
     print(colorize(f"{'='*80}", 'BOLD'))
     
     # Track what we've seen to organize output
-    has_request_headers = False
-    has_request_body = False
-    has_outgoing_request = False
-    has_response = False
+    seen = set()
     has_error = False
     
     for detail in request['details']:
         message = detail['message']
-        level = detail['level']
-        
-        # Request Headers
-        if message.startswith('Request Headers:'):
-            has_request_headers = True
-            if verbose:
-                print(colorize("\nREQUEST HEADERS:", 'BLUE'))
-                headers_str = message.replace('Request Headers: ', '')
-                try:
-                    headers = eval(headers_str)
-                    for key, value in headers.items():
-                        print(f"  {colorize(key, 'CYAN')}: {value}")
-                except:
-                    print(f"  {headers_str}")
-        
-        # Request Body
-        elif message.startswith('Request Body:'):
-            has_request_body = True
-            print(colorize("\nREQUEST BODY:", 'BLUE'))
-            body_str = message.replace('Request Body: ', '')
-            print(f"  {format_json(body_str)}")
-        
-        # Outgoing Request
-        elif message.startswith('OUTGOING REQUEST'):
-            has_outgoing_request = True
-            print(colorize("\nOUTGOING REQUEST:", 'MAGENTA'))
-            print(f"  {message.split(' - ')[1]}")
+        key = message.partition(':')[0].partition(' - ')[0]
+        entry = _DETAIL_HANDLERS.get(key)
         
-        # Outgoing Headers
-        elif message.startswith('Outgoing Headers:'):
-            if verbose:
-                print(colorize("\nOUTGOING HEADERS:", 'MAGENTA'))
-                print(f"  {message.replace('Outgoing Headers: ', '')}")
+        if entry is not None:
+            handler, verbose_only = entry
+            seen.add(key)
+            if verbose or not verbose_only:
+                handler(message)
+            if key == 'Error Response Body':
+                has_error = True
         
-        # Outgoing Body
-        elif message.startswith('Outgoing Body:'):
-            print(colorize("\nOUTGOING BODY:", 'MAGENTA'))
-            body_str = message.replace('Outgoing Body: ', '')
-            print(f"  {format_json(body_str)}")
-        
-        # Response
-        elif message.startswith('RESPONSE from Databricks'):
-            has_response = True
-            print(colorize("\nRESPONSE:", 'GREEN'))
-            print(f"  {message.split(' - ')[1]}")
-        
-        # Response Body
-        elif message.startswith('Response Body:'):
-            print(colorize("\nRESPONSE BODY:", 'GREEN'))
-            body_str = message.replace('Response Body: ', '')
-            print(f"  {format_json(body_str)}")
-        
-        # Error
-        elif level == 'ERROR' or message.startswith('ERROR'):
+        # Any other error line
+        elif detail['level'] == 'ERROR' or message.startswith('ERROR'):
             has_error = True
-            print(colorize("\nERROR:", 'RED'))
-            print(f"  {message}")
-        
-        # Error Response Body
-        elif message.startswith('Error Response Body:'):
-            print(colorize("\nERROR RESPONSE BODY:", 'RED'))
-            body_str = message.replace('Error Response Body: ', '')
-            print(f"  {format_json(body_str)}")
+            _show_error(message)
     
     # Summary
     print(colorize("\nSUMMARY:", 'YELLOW'))
     print(f"  Request Type: {colorize(request['type'], 'BOLD')}")
     print(f"  Timestamp: {request['timestamp']}")
-    if has_request_body:
+    if 'Request Body' in seen:
         print(f"  Request Body: {colorize('Yes', 'GREEN')}")
-    if has_outgoing_request:
+    if 'OUTGOING REQUEST' in seen:
         print(f"  Forwarded to Databricks: {colorize('Yes', 'GREEN')}")
-    if has_response:
+    if 'RESPONSE from Databricks' in seen:
         print(f"  Received Response: {colorize('Yes', 'GREEN')}")
     if has_error:
         print(f"  Errors: {colorize('Yes', 'RED')}")
@@ -187,15 +212,17 @@ def main():
         print(colorize(f"Error: Log file '{args.file}' not found.", 'RED'))
         return 1
     
-    # Read log file
-    with open(args.file, 'r') as f:
-        lines = f.readlines()
-    
-    # Parse log lines
-    log_lines = [parse_log_line(line) for line in lines]
-    
-    # Group by request
-    requests = group_request_logs(log_lines)
+    # Map regular log files and parse them in place, grouping lines by request as they
+    # are read; pipes and FIFOs (e.g. -f <(docker logs ...)) can't be mapped and are read whole
+    with open(args.file, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            requests = group_request_logs(parse_log_lines(f.read()))
+        elif st.st_size == 0:
+            requests = []
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                requests = group_request_logs(parse_log_lines(mm))
     
     # Filter requests if needed
     if args.errors:
@@ -0,0 +1,9 @@
+"""
+WSGI entrypoint for running the gateway under Gunicorn's gevent workers.
+Monkey-patching must happen before requests/urllib3 (and ssl) are imported by app.py.
+"""
+
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402